@@ -0,0 +1,4 @@
+"""
+Audiobook Reader application package.
+Run with: python -m audiobook_reader
+"""
@@ -2,20 +2,20 @@
 """
 Audiobook Reader - Main Application
 A Python application for playing audiobooks using tkinter GUI.
+
+Run with: python -m audiobook_reader
 """
 
+import logging
 import tkinter as tk
-from tkinter import ttk
-import sys
-import os
-
-# Add the project root to the Python path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
-from gui.main_window import AudiobookReaderApp
 
 def main():
     """Main function to start the audiobook reader application."""
+    # Imported here so that importing this module stays cheap
+    from gui.main_window import AudiobookReaderApp
+    
+    logging.basicConfig(level=logging.WARNING)
+    
     root = tk.Tk()
     app = AudiobookReaderApp(root)
     root.mainloop()
@@ -1,9 +1,27 @@
 """
 Core package for the Audiobook Reader application.
 Contains the main business logic and audio processing components.
+
+Submodules are imported on first attribute access, so importing
+core.formats does not load the VLC bindings.
 """
 
-from .audio_player import AudioPlayer
-from .audiobook import Audiobook
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    'AudioPlayer': 'audio_player',
+    'Audiobook': 'audiobook',
+    'SUPPORTED_EXTS': 'formats',
+}
+
+__all__ = ['AudioPlayer', 'Audiobook', 'SUPPORTED_EXTS']
+
 
-__all__ = ['AudioPlayer', 'Audiobook'] 
\ No newline at end of file
+def __getattr__(name):
+    """Import the defining submodule lazily when a public name is accessed."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{module_name}", __name__)
+    return getattr(module, name)
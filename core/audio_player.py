@@ -2,11 +2,29 @@
 Audio player class for handling audiobook playback using python-vlc (lightweight).
 """
 
-import vlc
-import threading
+import atexit
 import time
+import vlc
 from pathlib import Path
 
+# One VLC instance per process, shared by every AudioPlayer
+_VLC_INSTANCE = None
+
+# Audio-only playback: skip video, subtitle, OSD and stats subsystems
+_VLC_ARGS = (
+    '--no-xlib', '--quiet', '--intf', 'dummy',
+    '--no-video', '--no-spu', '--no-osd', '--no-stats', '--no-sub-autodetect-file'
+)
+
+
+def _get_vlc_instance():
+    """Get the shared VLC instance, creating it on first use."""
+    global _VLC_INSTANCE
+    if _VLC_INSTANCE is None:
+        _VLC_INSTANCE = vlc.Instance(*_VLC_ARGS)
+    return _VLC_INSTANCE
+
+
 class AudioPlayer:
     """Lightweight audio player using python-vlc."""
     def __init__(self):
@@ -14,15 +32,27 @@ class AudioPlayer:
         self.is_loaded = False
         self.is_playing = False
         self.is_paused = False
-        self.current_position = 0
+        # (position in integer nanoseconds, monotonic time of that report):
+        # published as one tuple so VLC's event thread can replace it and the
+        # GUI thread can read it without a lock and never see a torn pair.
+        self._pos = (0, time.monotonic_ns())
         self.duration = 0        
-        # Initialize VLC instance
-        self.vlc_instance = vlc.Instance('--no-xlib', '--quiet')
+        self.media = None
+        # Use the shared VLC instance; each player only needs its own media player
+        self.vlc_instance = _get_vlc_instance()
         self.media_player = self.vlc_instance.media_player_new()
         
-        # Thread for monitoring playback
-        self.monitor_thread = None
-        self.stop_monitoring = False
+        # Let VLC push playback updates instead of polling for them
+        self.event_manager = self.media_player.event_manager()
+        self.event_manager.event_attach(vlc.EventType.MediaPlayerTimeChanged, self._on_time_changed)
+        self.event_manager.event_attach(vlc.EventType.MediaPlayerPositionChanged, self._on_position_changed)
+        self.event_manager.event_attach(vlc.EventType.MediaPlayerEndReached, self._on_end_reached)
+        # Covers files whose parse timed out or failed: VLC reports the length once playing
+        self.event_manager.event_attach(vlc.EventType.MediaPlayerLengthChanged, self._on_length_changed)
+        
+        # Safety net in case cleanup() is never called explicitly
+        self._released = False
+        atexit.register(self.cleanup)
     
     def load_file(self, file_path):
         """Load an audio file for playback."""
@@ -35,8 +65,10 @@ class AudioPlayer:
             media = self.vlc_instance.media_new(str(self.file_path))
             self.media_player.set_media(media)
             
-            # Parse media to get duration
-            self.duration = self._get_duration(media)
+            # Parse media in the background; duration is set when parsing finishes
+            self.media = media
+            self.duration = 0
+            self._start_parse(media)
             
             self.is_loaded = True
             self.current_position = 0
@@ -45,15 +77,24 @@ class AudioPlayer:
             self.is_loaded = False
             raise Exception(f"Failed to load audio file: {e}")
     
-    def _get_duration(self, media):
-        """Get the duration of the loaded audio file, ensuring media is parsed."""
+    def _start_parse(self, media):
+        """Start asynchronous parsing of the media to read its duration."""
         try:
-            # Parse the media (blocking)
-            media.parse()
-            duration_ms = media.get_duration()
-            return duration_ms / 1000 if duration_ms > 0 else 0
-        except Exception:
-            return 0
+            media.event_manager().event_attach(
+                vlc.EventType.MediaParsedChanged, self._on_parsed, media
+            )
+            # Returns immediately; MediaParsedChanged fires when done (5 s timeout)
+            media.parse_with_options(vlc.MediaParseFlag.local, 5000)
+        except Exception as e:
+            print(f"Error parsing media: {e}")
+    
+    def _on_parsed(self, event, media):
+        """Store the duration once VLC has parsed the media."""
+        if media is not self.media:
+            return  # A different file was loaded in the meantime
+        duration_ms = media.get_duration()
+        if duration_ms > 0:
+            self.duration = duration_ms / 1000
     
     def play(self):
         """Start playing the loaded audio file."""
@@ -62,12 +103,9 @@ class AudioPlayer:
         
         try:
             self.media_player.play()
+            self._pos = (self._pos[0], time.monotonic_ns())
             self.is_playing = True
             self.is_paused = False
-            
-            # Start monitoring thread
-            self._start_monitoring()
-            
         except Exception as e:
             raise Exception(f"Failed to play audio: {e}")
     
@@ -78,6 +116,8 @@ class AudioPlayer:
         
         try:
             self.media_player.pause()
+            # Freeze the extrapolated position at the moment of pausing
+            self.current_position = self.get_position()
             self.is_playing = False
             self.is_paused = True
         except Exception as e:
@@ -90,6 +130,7 @@ class AudioPlayer:
         
         try:
             self.media_player.pause()  # VLC pause() toggles pause/play
+            self._pos = (self._pos[0], time.monotonic_ns())
             self.is_playing = True
             self.is_paused = False
         except Exception as e:
@@ -105,10 +146,6 @@ class AudioPlayer:
             self.is_playing = False
             self.is_paused = False
             self.current_position = 0
-            
-            # Stop monitoring
-            self._stop_monitoring()
-            
         except Exception as e:
             print(f"Error stopping audio: {e}")
     
@@ -125,18 +162,61 @@ class AudioPlayer:
         except Exception as e:
             print(f"Error setting position: {e}")
     
+    def skip(self, delta):
+        """Move the playback position by delta seconds.
+        
+        The target is clamped to [0, duration - 1] (no upper bound while the
+        duration is still unknown) and applied with a single seek.
+        """
+        if not self.is_loaded:
+            return
+        
+        new_position = self.get_position() + delta
+        duration = self.get_duration()
+        if duration > 0:
+            new_position = min(new_position, max(duration - 1, 0))
+        self.set_position(max(new_position, 0))
+    
     def get_position(self):
-        """Get the current playback position in seconds."""
+        """Get the current playback position in seconds.
+        
+        While playing, the last position reported by VLC is extrapolated by
+        the time elapsed since that report (playback rate is always 1.0), so
+        the position advances smoothly even when VLC events are sparse.
+        """
         if not self.is_loaded:
-            return 0      
-        try:
-            position_ms = self.media_player.get_time()
-            return position_ms / 1000 if position_ms > 0 else 0
-        except Exception as e:
-            print(f"Error getting position: {e}")
-            return 0    
+            return 0
+        position_ns, reported_ns = self._pos
+        if self.is_playing:
+            position_ns += time.monotonic_ns() - reported_ns
+            if self.duration > 0:
+                position_ns = min(position_ns, int(self.duration * 1_000_000_000))
+        return position_ns / 1e9
+    
+    @property
+    def current_position(self):
+        """Current playback position in seconds, as last reported by VLC."""
+        return self._pos[0] / 1e9
+    
+    @current_position.setter
+    def current_position(self, seconds):
+        self._pos = (int(seconds * 1_000_000_000), time.monotonic_ns())
+    
     def get_duration(self):
-        """Get the total duration of the audio file in seconds."""
+        """Get the total duration of the audio file in seconds.
+        
+        If parsing has not produced a duration (timed out or failed), ask
+        the media player and the media directly.
+        """
+        if self.duration <= 0 and self.is_loaded:
+            try:
+                length_ms = self.media_player.get_length()
+                if length_ms <= 0 and self.media is not None:
+                    length_ms = self.media.get_duration()
+                if length_ms > 0:
+                    self.duration = length_ms / 1000
+            except Exception as e:
+                print(f"Error getting duration: {e}")
         return self.duration
     
     def set_volume(self, volume):
@@ -165,44 +245,46 @@ class AudioPlayer:
         """Check if audio is currently paused."""
         return self.is_paused
     
-    def _start_monitoring(self):
-        """Start the monitoring thread for tracking playback position."""
-        self.stop_monitoring = False
-        self.monitor_thread = threading.Thread(target=self._monitor_playback, daemon=True)
-        self.monitor_thread.start()
-    
-    def _stop_monitoring(self):
-        """Stop the monitoring thread."""
-        self.stop_monitoring = True
-        if self.monitor_thread:
-            self.monitor_thread.join(timeout=1)
-    
-    def _monitor_playback(self):
-        """Monitor playback and update position."""
-        while not self.stop_monitoring and self.is_playing:
-            try:
-                # Update current position
-                self.current_position = self.get_position()
-                
-                # Check if playback has ended
-                if self.media_player.get_state() == vlc.State.Ended:
-                    self.is_playing = False
-                    break
-                
-                time.sleep(0.1)  # Update every 100ms
-                
-            except Exception as e:
-                print(f"Error monitoring playback: {e}")
-                break
+    def _on_time_changed(self, event):
+        """Update the current position when VLC reports a new playback time."""
+        self._pos = (event.u.new_time * 1_000_000, time.monotonic_ns())
+    
+    def _on_position_changed(self, event):
+        """Update the current position from VLC's relative position (0.0-1.0)."""
+        if self.duration > 0:
+            self._pos = (int(event.u.new_position * self.duration * 1_000_000_000),
+                         time.monotonic_ns())
+    
+    def _on_length_changed(self, event):
+        """Store the duration when VLC learns the media length during playback."""
+        if event.u.new_length > 0:
+            self.duration = event.u.new_length / 1000
+    
+    def _on_end_reached(self, event):
+        """Mark playback as finished when VLC reaches the end of the media."""
+        self.is_playing = False
+        self.is_paused = False
     
     def cleanup(self):
-        """Clean up resources."""
+        """Clean up resources. Safe to call more than once."""
+        if self._released:
+            return
+        self._released = True
+        atexit.unregister(self.cleanup)
         try:
             self.stop()
+            self.event_manager.event_detach(vlc.EventType.MediaPlayerTimeChanged)
+            self.event_manager.event_detach(vlc.EventType.MediaPlayerPositionChanged)
+            self.event_manager.event_detach(vlc.EventType.MediaPlayerEndReached)
             self.media_player.release()
-            self.vlc_instance.release()
         except Exception as e:
-            print(f"Error during cleanup: {e}")    
-    def __del__(self):
-        """Destructor to ensure cleanup."""
-        self.cleanup() 
\ No newline at end of file
+            print(f"Error during cleanup: {e}")
+    
+    def __enter__(self):
+        """Use the player as a context manager that cleans up on exit."""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Release VLC resources when leaving the context."""
+        self.cleanup()
+        return False
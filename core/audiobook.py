@@ -5,11 +5,33 @@ Audiobook class for managing audiobook metadata and information.
 from pathlib import Path
 import os
 from datetime import datetime
+from utils.audio_utils import format_file_size
+from .formats import SUPPORTED_EXTS
+
+# Optional metadata/decoding backends, resolved once at import time
+try:
+    from mutagen import File as MutagenFile
+    _HAS_MUTAGEN = True
+except ImportError:
+    MutagenFile = None
+    _HAS_MUTAGEN = False
+
+try:
+    from pydub import AudioSegment
+    _HAS_PYDUB = True
+except ImportError:
+    AudioSegment = None
+    _HAS_PYDUB = False
 
 
 class Audiobook:
     """Represents an audiobook with metadata and file information."""
     
+    __slots__ = (
+        'file_path', 'title', 'filename', 'file_size', 'file_extension',
+        '_mtime', '_modified_date', '_duration'
+    )
+    
     def __init__(self, file_path):
         """Initialize an Audiobook object.
         
@@ -21,38 +43,62 @@ class Audiobook:
     
     def _load_metadata(self):
         """Load metadata from the audiobook file."""
-        if not self.file_path.exists():
-            raise FileNotFoundError(f"Audiobook file not found: {self.file_path}")
+        # A single stat; raises FileNotFoundError if the file is missing
+        st = os.stat(self.file_path)
         
         # Basic file information
         self.title = self.file_path.stem
         self.filename = self.file_path.name
-        self.file_size = self.file_path.stat().st_size
-        self.file_extension = self.file_path.suffix.lower()
+        self.file_size = st.st_size
+        _, dot, ext = self.filename.rpartition('.')
+        self.file_extension = f".{ext.lower()}" if dot else ""
         
-        # File modification time
-        mtime = self.file_path.stat().st_mtime
-        self.modified_date = datetime.fromtimestamp(mtime)
+        # File modification time (converted to a datetime on demand)
+        self._mtime = st.st_mtime
+        self._modified_date = None
+        
+        # Duration is computed on first access
+        self._duration = None
         
         # Validate file format
         self._validate_format()
     
     def _validate_format(self):
         """Validate that the file is a supported audio format."""
-        supported_formats = {'.mp3', '.wav', '.ogg', '.flac', '.m4a', '.aac'}
-        if self.file_extension not in supported_formats:
+        if self.file_extension not in SUPPORTED_EXTS:
             raise ValueError(f"Unsupported audio format: {self.file_extension}")
     
+    @property
+    def modified_date(self):
+        """Get the file modification time as a datetime (computed on first access)."""
+        if self._modified_date is None:
+            self._modified_date = datetime.fromtimestamp(self._mtime)
+        return self._modified_date
+    
     @property
     def duration(self):
-        """Get the duration of the audiobook in seconds."""
+        """Get the duration of the audiobook in seconds (cached after first access)."""
+        if self._duration is None:
+            self._duration = self._compute_duration()
+        return self._duration
+    
+    def _compute_duration(self):
+        """Read the duration from the file, preferring a header-only probe."""
+        if _HAS_MUTAGEN:
+            try:
+                audio = MutagenFile(str(self.file_path))
+                if audio is not None and audio.info is not None:
+                    return audio.info.length
+            except Exception as e:
+                print(f"Error reading duration metadata: {e}")
+        
+        if not _HAS_PYDUB:
+            return 0
+        
         try:
-            from pydub import AudioSegment
+            # Fallback: decode the whole file with pydub
             audio = AudioSegment.from_file(str(self.file_path))
             return len(audio) / 1000.0  # Convert from milliseconds to seconds
-        except ImportError:
-            # Fallback if pydub is not available
-            return 0
         except Exception as e:
             print(f"Error getting duration: {e}")
             return 0
@@ -64,9 +110,8 @@ class Audiobook:
         if duration == 0:
             return "Unknown"
         
-        hours = int(duration // 3600)
-        minutes = int((duration % 3600) // 60)
-        seconds = int(duration % 60)
+        hours, remainder = divmod(int(duration), 3600)
+        minutes, seconds = divmod(remainder, 60)
         
         if hours > 0:
             return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
@@ -76,12 +121,7 @@ class Audiobook:
     @property
     def formatted_size(self):
         """Get the file size formatted as human-readable string."""
-        size = self.file_size
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size < 1024.0:
-                return f"{size:.1f} {unit}"
-            size /= 1024.0
-        return f"{size:.1f} TB"
+        return format_file_size(self.file_size)
     
     def get_info(self):
         """Get a dictionary with all audiobook information."""
@@ -0,0 +1,6 @@
+"""
+Supported audio formats for the Audiobook Reader application.
+"""
+
+# Audio file extensions (lowercase, with the leading dot)
+SUPPORTED_EXTS = frozenset({'.mp3', '.wav', '.ogg', '.flac', '.m4a', '.aac'})
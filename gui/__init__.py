@@ -6,5 +6,6 @@ Contains all the user interface components.
 from .main_window import AudiobookReaderApp
 from .library_screen import LibraryScreen
 from .player_screen import PlayerScreen
+from .styles import apply_styles
 
-__all__ = ['AudiobookReaderApp', 'LibraryScreen', 'PlayerScreen'] 
\ No newline at end of file
+__all__ = ['AudiobookReaderApp', 'LibraryScreen', 'PlayerScreen', 'apply_styles'] 
\ No newline at end of file
@@ -5,8 +5,85 @@ Library screen for browsing and selecting audiobooks.
 import tkinter as tk
 from tkinter import ttk, messagebox
 import os
+import shutil
+import subprocess
+import queue
 from pathlib import Path
 from core.audiobook import Audiobook
+from core.formats import SUPPORTED_EXTS
+from utils.file_utils import is_audio_filename
+
+# Optional: watch the library directory instead of rescanning it
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    _HAS_WATCHDOG = True
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+    _HAS_WATCHDOG = False
+
+
+# How often queued watcher events are applied to the list (milliseconds)
+WATCH_POLL_MS = 250
+
+
+def _iter_audio(directory):
+    """Recursively yield paths of audio files under a directory using os.scandir."""
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_audio(entry.path)
+            elif entry.is_file() and is_audio_filename(entry.name):
+                yield entry.path
+
+
+def _link_or_copy(src, dst):
+    """Place a file in the library without duplicating its data when possible.
+    
+    Tries a hard link (same file system), then a reflink copy (Btrfs/XFS),
+    and finally a regular copy.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        try:
+            subprocess.run(['cp', '--reflink=auto', str(src), str(dst)], check=True,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except Exception:
+            shutil.copy2(src, dst)
+
+
+class _LibraryEventHandler(FileSystemEventHandler):
+    """Queue file system events for the library screen to apply on the Tk thread.
+    
+    Tk must not be called from the observer thread, so events only go onto
+    the screen's queue; LibraryScreen._poll_events drains it from root.after.
+    """
+    
+    def __init__(self, screen):
+        self.screen = screen
+    
+    def on_created(self, event):
+        if event.is_directory:
+            # A folder moved in from outside the library arrives with its contents
+            self.screen._events.put((self.screen._on_dir_added, event.src_path))
+        else:
+            self.screen._events.put((self.screen._on_file_added, event.src_path))
+    
+    def on_deleted(self, event):
+        if event.is_directory:
+            self.screen._events.put((self.screen._on_dir_removed, event.src_path))
+        else:
+            self.screen._events.put((self.screen._on_file_removed, event.src_path))
+    
+    def on_moved(self, event):
+        if event.is_directory:
+            self.screen._events.put((self.screen._on_dir_removed, event.src_path))
+            self.screen._events.put((self.screen._on_dir_added, event.dest_path))
+        else:
+            self.screen._events.put((self.screen._on_file_removed, event.src_path))
+            self.screen._events.put((self.screen._on_file_added, event.dest_path))
 
 
 class LibraryScreen:
@@ -17,17 +94,22 @@ class LibraryScreen:
         self.root = root
         self.app = app
         self.frame = None
-        self.audiobooks = []
+        self.audiobook_paths = []
         self.selected_audiobook = None
+        self._observer = None
+        self._events = queue.Queue()
+        self._poll_id = None
         
         # Create the main frame
         self.create_widgets()
+        
+        # Keep the list up to date from file system events when possible
+        self.start_watcher()
     
     def create_widgets(self):
         """Create and configure all widgets for the library screen."""
-        # Main frame
+        # Main frame (gridded once all children exist, for a single layout pass)
         self.frame = ttk.Frame(self.root)
-        self.frame.grid(row=0, column=0, sticky="nsew", padx=20, pady=20)
         
         # Configure grid weights
         self.frame.grid_rowconfigure(1, weight=1)
@@ -63,9 +145,9 @@ class LibraryScreen:
         self.audiobooks_listbox.grid(row=0, column=0, sticky="nsew")
         
         # Scrollbar for listbox
-        scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.audiobooks_listbox.yview)
-        scrollbar.grid(row=0, column=1, sticky="ns")
-        self.audiobooks_listbox.configure(yscrollcommand=scrollbar.set)
+        self.scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.audiobooks_listbox.yview)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        self.audiobooks_listbox.configure(yscrollcommand=self.scrollbar.set)
         
         # Bind selection event
         self.audiobooks_listbox.bind('<<ListboxSelect>>', self.on_audiobook_select)
@@ -93,15 +175,18 @@ class LibraryScreen:
         )
         quit_button.grid(row=3, column=0, sticky="ew")
 
-        # Style for even bigger buttons
-        style = ttk.Style()
-        style.configure("Big.TButton", font=("Arial", 40, "bold"), background="white", foreground="black")
+        self.frame.grid(row=0, column=0, sticky="nsew", padx=20, pady=20)
+
         # Load audiobooks
         self.load_audiobooks()
     
     def load_audiobooks(self):
-        """Load audiobooks from the data directory."""
-        self.audiobooks = []
+        """Load audiobooks from the data directory.
+        
+        Only file paths are collected here; Audiobook objects are built
+        when a row is selected.
+        """
+        self.audiobook_paths = []
         self.audiobooks_listbox.delete(0, tk.END)
         
         audiobooks_dir = Path("data/audiobooks")
@@ -110,18 +195,16 @@ class LibraryScreen:
             return
         
         # Scan for audio files
-        audio_extensions = {'.mp3', '.wav', '.ogg', '.flac', '.m4a'}
+        self.audiobook_paths = [Path(path) for path in _iter_audio(audiobooks_dir)]
         
-        for file_path in audiobooks_dir.rglob("*"):
-            if file_path.is_file() and file_path.suffix.lower() in audio_extensions:
-                try:
-                    audiobook = Audiobook(file_path)
-                    self.audiobooks.append(audiobook)
-                    self.audiobooks_listbox.insert(tk.END, audiobook.title)
-                except Exception as e:
-                    print(f"Error loading audiobook {file_path}: {e}")
+        # Insert all titles in one Tcl call with scrollbar updates detached
+        if self.audiobook_paths:
+            titles = [file_path.stem for file_path in self.audiobook_paths]
+            self.audiobooks_listbox.configure(yscrollcommand="")
+            self.audiobooks_listbox.insert(tk.END, *titles)
+            self.audiobooks_listbox.configure(yscrollcommand=self.scrollbar.set)
         
-        if not self.audiobooks:
+        if not self.audiobook_paths:
             self.audiobooks_listbox.insert(tk.END, "No audiobooks found")
             self.audiobooks_listbox.itemconfig(0, fg="gray")
     
@@ -130,8 +213,14 @@ class LibraryScreen:
         selection = self.audiobooks_listbox.curselection()
         if selection:
             index = selection[0]
-            if index < len(self.audiobooks):
-                self.selected_audiobook = self.audiobooks[index]
+            if index < len(self.audiobook_paths):
+                file_path = self.audiobook_paths[index]
+                try:
+                    audiobook = Audiobook(file_path)
+                except Exception as e:
+                    print(f"Error loading audiobook {file_path}: {e}")
+                    return
+                self.selected_audiobook = audiobook
                 self.play_button.config(state="normal")
     
     def play_selected_audiobook(self):
@@ -152,20 +241,19 @@ class LibraryScreen:
         file_path = filedialog.askopenfilename(
             title="Select Audiobook File",
             filetypes=[
-                ("Audio files", "*.mp3 *.wav *.ogg *.flac *.m4a"),
+                ("Audio files", " ".join(f"*{ext}" for ext in sorted(SUPPORTED_EXTS))),
                 ("All files", "*.*")
             ]
         )
         
         if file_path:
             try:
-                # Copy file to audiobooks directory
-                import shutil
+                # Link or copy file to audiobooks directory
                 audiobooks_dir = Path("data/audiobooks")
                 audiobooks_dir.mkdir(parents=True, exist_ok=True)
                 
                 dest_path = audiobooks_dir / Path(file_path).name
-                shutil.copy2(file_path, dest_path)
+                _link_or_copy(file_path, dest_path)
                 
                 # Refresh library
                 self.refresh_library()
@@ -174,10 +262,110 @@ class LibraryScreen:
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to add audiobook: {e}")
     
+    def start_watcher(self):
+        """Watch the audiobooks directory for added and removed files."""
+        if not _HAS_WATCHDOG:
+            return
+        try:
+            audiobooks_dir = Path("data/audiobooks")
+            audiobooks_dir.mkdir(parents=True, exist_ok=True)
+            self._observer = Observer()
+            self._observer.schedule(_LibraryEventHandler(self), str(audiobooks_dir), recursive=True)
+            self._observer.start()
+        except Exception as e:
+            print(f"Error starting library watcher: {e}")
+            self._observer = None
+            return
+        self._poll_id = self.root.after(WATCH_POLL_MS, self._poll_events)
+    
+    def stop_watcher(self):
+        """Stop watching the audiobooks directory."""
+        if self._poll_id is not None:
+            self.root.after_cancel(self._poll_id)
+            self._poll_id = None
+        if self._observer:
+            self._observer.stop()
+            self._observer.join(timeout=1)
+            self._observer = None
+    
+    def _poll_events(self):
+        """Apply queued watcher events on the Tk thread, then poll again."""
+        while True:
+            try:
+                handler, path = self._events.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                handler(path)
+            except Exception as e:
+                print(f"Error applying library change for {path}: {e}")
+        self._poll_id = self.root.after(WATCH_POLL_MS, self._poll_events)
+    
+    def _on_file_added(self, path):
+        """Add a single row for a file that appeared in the library."""
+        file_path = Path(path)
+        if not is_audio_filename(file_path.name):
+            return
+        if file_path in self.audiobook_paths:
+            return
+        if not self.audiobook_paths:
+            # Remove the "No audiobooks found" placeholder
+            self.audiobooks_listbox.delete(0, tk.END)
+        self.audiobook_paths.append(file_path)
+        self.audiobooks_listbox.insert(tk.END, file_path.stem)
+    
+    def _on_file_removed(self, path):
+        """Remove the row of a file that disappeared from the library."""
+        file_path = Path(path)
+        if file_path not in self.audiobook_paths:
+            return
+        self._remove_rows([self.audiobook_paths.index(file_path)])
+    
+    def _on_dir_added(self, path):
+        """Add rows for the audio files in a folder that appeared in the library."""
+        try:
+            for file_path in sorted(_iter_audio(path)):
+                self._on_file_added(file_path)
+        except OSError:
+            # The folder was removed or renamed again before we got to it
+            pass
+    
+    def _on_dir_removed(self, path):
+        """Remove the rows of every file under a folder that disappeared."""
+        dir_path = Path(path)
+        indices = [i for i, file_path in enumerate(self.audiobook_paths)
+                   if dir_path in file_path.parents]
+        if indices:
+            self._remove_rows(indices)
+    
+    def _remove_rows(self, indices):
+        """Remove the given rows (indices into audiobook_paths) from the list."""
+        for index in sorted(indices, reverse=True):
+            file_path = self.audiobook_paths.pop(index)
+            self.audiobooks_listbox.delete(index)
+            if self.selected_audiobook and self.selected_audiobook.file_path == file_path:
+                self._clear_selection()
+        if not self.audiobook_paths:
+            self.audiobooks_listbox.insert(tk.END, "No audiobooks found")
+            self.audiobooks_listbox.itemconfig(0, fg="gray")
+    
+    def _clear_selection(self):
+        """Forget the selected audiobook and disable the play button."""
+        self.selected_audiobook = None
+        self.audiobooks_listbox.selection_clear(0, tk.END)
+        self.play_button.config(state="disabled")
+    
     def show(self):
-        """Show the library screen."""
+        """Show the library screen.
+        
+        The directory is only rescanned if no live watcher keeps the list
+        current, but the selection is always reset.
+        """
         self.frame.grid()
-        self.refresh_library()
+        if self._observer is None or not self._observer.is_alive():
+            self.refresh_library()
+        else:
+            self._clear_selection()
     
     def hide(self):
         """Hide the library screen."""
@@ -7,6 +7,7 @@ import tkinter as tk
 from tkinter import ttk
 from .library_screen import LibraryScreen
 from .player_screen import PlayerScreen
+from .styles import apply_styles
 
 
 class AudiobookReaderApp:
@@ -33,9 +34,9 @@ class AudiobookReaderApp:
         # Configure the main window
         self.setup_window()
         
-        # Initialize screens
+        # Initialize screens (created once and reused on every transition)
         self.current_screen = None
-        self.library_screen = None
+        self.library_screen = LibraryScreen(self.root, self)
         self.player_screen = None
         
         # Start with the library screen
@@ -49,13 +50,12 @@ class AudiobookReaderApp:
         except:
             pass
         
+        # Theme and the custom styles the screens reference
+        apply_styles(self.root)
+        
         # Configure grid weight for responsive layout
         self.root.grid_rowconfigure(0, weight=1)
         self.root.grid_columnconfigure(0, weight=1)
-        
-        # Style configuration
-        style = ttk.Style()
-        style.theme_use('clam')  # Use clam theme for better appearance
     
     def show_library_screen(self):
         """Show the audiobook library selection screen."""
@@ -63,8 +63,7 @@ class AudiobookReaderApp:
         if self.current_screen:
             self.current_screen.hide()
         
-        # Create and show library screen
-        self.library_screen = LibraryScreen(self.root, self)
+        # Show the existing library screen
         self.current_screen = self.library_screen
         self.library_screen.show()
     
@@ -74,8 +73,11 @@ class AudiobookReaderApp:
         if self.current_screen:
             self.current_screen.hide()
         
-        # Create and show player screen
-        self.player_screen = PlayerScreen(self.root, self, audiobook_path)
+        # Create the player screen on first use, then reuse it
+        if self.player_screen is None:
+            self.player_screen = PlayerScreen(self.root, self, audiobook_path)
+        else:
+            self.player_screen.load(audiobook_path)
         self.current_screen = self.player_screen
         self.player_screen.show()
     
@@ -86,8 +88,12 @@ class AudiobookReaderApp:
     
     def quit_app(self):
         """Safely quit the application."""
-        # Stop any playing audio
+        # Stop any playing audio and release VLC resources
         if self.player_screen:
             self.player_screen.stop_audio()
+            self.player_screen.audio_player.cleanup()
+        
+        # Stop watching the library directory
+        self.library_screen.stop_watcher()
         
         self.root.quit() 
\ No newline at end of file
@@ -4,32 +4,52 @@ Player screen for controlling audiobook playback (lightweight version with pytho
 
 import tkinter as tk
 from tkinter import ttk
-import threading
 import time
 from pathlib import Path
 from core.audio_player import AudioPlayer
-from utils.file_utils import save_position, get_position
+from utils.file_utils import save_position, get_position, flush_positions
+from utils.audio_utils import format_duration
+
+# Seconds between background progress saves while playing
+SAVE_INTERVAL = 5.0
+
+# Skip button step, and minimum seconds between accepted skip clicks
+SKIP_SECONDS = 30
+SKIP_DEBOUNCE = 0.1
 
 class PlayerScreen:
     """Screen for playing and controlling audiobook playback (lightweight with python-vlc)."""
     def __init__(self, root, app, audiobook_path):
         self.root = root
         self.app = app
+        # Keep the string form too: VLC and the progress DB both take strings
+        self.audiobook_path_str = str(audiobook_path)
         self.audiobook_path = Path(audiobook_path)
         self.frame = None
         self.audio_player = AudioPlayer()
         
         # UI state
         self.is_playing = False
-        self.update_thread = None
-        self.stop_update = False
+        self._after_id = None
+        # Last values written to the widgets (dirty flags)
+        self._last_sec = -1
+        self._last_progress_pct = -1
+        self._duration = 0
+        self._seconds_per_pct = 0.0
+        self._pct_per_second = 0.0
+        self._total_time_str = None
+        # Periodic progress saving
+        self._last_saved_sec = -1
+        self._last_save_ts = 0.0
+        self._last_skip_ts = 0.0
         
         self.create_widgets()
         self.load_audiobook()
 
     def create_widgets(self):
+        # The frame is gridded into the window only after all children exist,
+        # so the whole screen is laid out in a single geometry pass
         self.frame = ttk.Frame(self.root)
-        self.frame.grid(row=0, column=0, sticky="nsew", padx=20, pady=20)
         self.frame.grid_rowconfigure(2, weight=1)
         self.frame.grid_columnconfigure(0, weight=1)
 
@@ -56,23 +76,6 @@ class PlayerScreen:
         time_frame.grid(row=0, column=0, sticky="ew")
         time_frame.grid_columnconfigure(1, weight=1)
 
-        # Progress bar style for bigger height
-        style = ttk.Style()
-        style.configure("Big.Horizontal.TScale",
-                        troughcolor="white",
-                        sliderthickness=60,  # Aumentei para garantir que fique maior
-                        thickness=40,
-                        sliderlength=80,
-                        length=100,
-                        background="black",  # Cor de fundo base do slider
-                        foreground="black")  # Cor de primeiro plano do slider (pode ser redundante com background em alguns temas)
-
-        # Garante que a cor azul se mantém em outros estados (pode ser necessário dependendo do tema)
-        style.map("Big.Horizontal.TScale",
-                  background=[("active", "black"), ("!disabled", "black")],
-                  foreground=[("active", "black"), ("!disabled", "black")])
-        style.configure("Big.TButton", font=("Arial", 40, "bold"), background="white", foreground="black")
-
         # Time labels
         self.current_time_label = ttk.Label(time_frame, text="00:00", font=("Arial", 40, "bold"))
         self.current_time_label.grid(row=0, column=0, padx=(0, 10))
@@ -82,7 +85,7 @@ class PlayerScreen:
         self.progress_var = tk.DoubleVar()
         self.progress_bar = ttk.Scale(
             progress_frame,
-            from_=20, to=80,
+            from_=0, to=100,
             orient="horizontal",
             variable=self.progress_var,
             command=self.on_progress_change,
@@ -146,11 +149,23 @@ class PlayerScreen:
         )
         self.stop_button.grid(row=2, column=0, pady=(200, 0))
 
+        self.frame.grid(row=0, column=0, sticky="nsew", padx=20, pady=20)
+
+    def load(self, audiobook_path):
+        """Switch the screen to another audiobook without rebuilding widgets."""
+        self.audiobook_path_str = str(audiobook_path)
+        self.audiobook_path = Path(audiobook_path)
+        self.is_playing = False
+        self.play_button.config(text="OUVIR")
+        self.progress_var.set(0)
+        self.load_audiobook()
+
     def load_audiobook(self):
         try:
-            self.audio_player.load_file(str(self.audiobook_path))
+            self.audio_player.load_file(self.audiobook_path_str)
+            self._set_duration(self.audio_player.get_duration())
             # Restore last position if available
-            self.last_position = get_position(str(self.audiobook_path))
+            self.last_position = get_position(self.audiobook_path_str)
             title = self.audiobook_path.stem
             self.title_label.config(text=title)
             self.start_progress_update()
@@ -181,6 +196,8 @@ class PlayerScreen:
             self.audio_player.play()
             self.is_playing = True
             self.play_button.config(text="PAUSAR")
+            # Switch to the playing cadence now rather than after the idle delay
+            self.start_progress_update()
         except Exception as e:
             print(f"Error playing audio: {e}")
 
@@ -189,6 +206,7 @@ class PlayerScreen:
             self.audio_player.pause()
             self.is_playing = False
             self.play_button.config(text="OUVIR")
+            self.start_progress_update()
         except Exception as e:
             print(f"Error pausing audio: {e}")
 
@@ -198,35 +216,42 @@ class PlayerScreen:
             self.is_playing = False
             self.play_button.config(text="OUVIR")
             self.progress_var.set(0)
+            self.start_progress_update()
         except Exception as e:
             print(f"Error stopping audio: {e}")
 
     def skip_forward(self):
+        if not self._skip_allowed():
+            return
         try:
-            current_pos = self.audio_player.get_position()
-            duration = self.audio_player.get_duration()
-            if current_pos + 30 >= duration:
-                new_pos = max(duration - 1, 0)
-            else:
-                new_pos = current_pos + 30
-            self.audio_player.set_position(new_pos)
+            self.audio_player.skip(SKIP_SECONDS)
+            self.start_progress_update()
         except Exception as e:
             print(f"Error skipping forward: {e}")
 
     def skip_backward(self):
+        if not self._skip_allowed():
+            return
         try:
-            current_pos = self.audio_player.get_position()
-            new_pos = max(current_pos - 30, 0)
-            self.audio_player.set_position(new_pos)
+            self.audio_player.skip(-SKIP_SECONDS)
+            self.start_progress_update()
         except Exception as e:
             print(f"Error skipping backward: {e}")
 
+    def _skip_allowed(self):
+        # Ignore clicks arriving faster than SKIP_DEBOUNCE so seeks don't pile up
+        now = time.monotonic()
+        if now - self._last_skip_ts < SKIP_DEBOUNCE:
+            return False
+        self._last_skip_ts = now
+        return True
+
     def on_progress_change(self, value):
         try:
             if self.audio_player.is_file_loaded():
-                duration = self.audio_player.get_duration()
-                new_position = (float(value) / 100) * duration
+                new_position = float(value) * self._seconds_per_pct
                 self.audio_player.set_position(new_position)
+                self.start_progress_update()
         except Exception as e:
             print(f"Error changing progress: {e}")
 
@@ -239,59 +264,96 @@ class PlayerScreen:
             print(f"Error changing volume: {e}")
 
     def start_progress_update(self):
-        self.stop_update = False
-        self.update_thread = threading.Thread(target=self.update_progress, daemon=True)
-        self.update_thread.start()
-
-    def update_progress(self):
-        while not self.stop_update:
-            try:
-                if self.audio_player.is_file_loaded():
-                    current_pos = self.audio_player.get_position()
+        """Start (or restart) the progress tick on the Tk event loop."""
+        self.stop_progress_update()
+        self._last_sec = -1
+        self._last_progress_pct = -1
+        self._tick()
+
+    def stop_progress_update(self):
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _tick(self):
+        try:
+            if self.audio_player.is_file_loaded():
+                current_pos = self.audio_player.get_position()
+                if self._duration <= 0:
+                    # VLC may only know the duration once async parsing is done
                     duration = self.audio_player.get_duration()
-                    
                     if duration > 0:
-                        progress = (current_pos / duration) * 100
-                        self.root.after(0, self.update_progress_ui, current_pos, duration, progress)
+                        self._set_duration(duration)
+                duration = self._duration
+                
+                # Only touch a widget when the value it displays has changed
+                needs_redraw = False
+                if duration > 0:
+                    progress_pct = round(current_pos * self._pct_per_second, 1)
+                    if progress_pct != self._last_progress_pct:
+                        self.progress_var.set(progress_pct)
+                        self._last_progress_pct = progress_pct
+                        needs_redraw = True
                     
-                    if self.is_playing and current_pos >= duration:
-                        self.root.after(0, self.on_audio_finished)
+                    sec = int(current_pos)
+                    if sec != self._last_sec:
+                        self.current_time_label.config(text=self.format_time(sec))
+                        self._last_sec = sec
+                        needs_redraw = True
+                
+                # Playback finished: VLC reported EndReached (the player is no
+                # longer playing), or the extrapolated position ran past the end
+                if self.is_playing and (not self.audio_player.is_audio_playing()
+                                        or 0 < duration <= current_pos):
+                    self.is_playing = False
+                    self.play_button.config(text="OUVIR")
+                    needs_redraw = True
                 
-                time.sleep(0.5)  # Update every 500ms (less frequent for better performance)
+                # Repaint all changed widgets in a single pass
+                if needs_redraw:
+                    self.frame.update_idletasks()
                 
-            except Exception as e:
-                print(f"Error updating progress: {e}")
-                time.sleep(1)
-
-    def update_progress_ui(self, current_pos, duration, progress):
-        try:
-            self.progress_var.set(progress)
-            current_time = self.format_time(current_pos)
-            total_time = self.format_time(duration)
-            self.current_time_label.config(text=current_time)
-            self.total_time_label.config(text=total_time)
+                if self.is_playing and duration > 0:
+                    self._maybe_save_position(current_pos)
         except Exception as e:
-            print(f"Error updating progress UI: {e}")
+            print(f"Error updating progress: {e}")
+        
+        # Smoother updates while playing, near-idle while paused or stopped
+        delay = 250 if self.is_playing else 2000
+        self._after_id = self.root.after(delay, self._tick)
+
+    def _maybe_save_position(self, current_pos):
+        # Save progress every SAVE_INTERVAL seconds so a crash loses little;
+        # save_position only queues the value, the DB write happens on its timer
+        now = time.monotonic()
+        sec = int(current_pos)
+        if now - self._last_save_ts < SAVE_INTERVAL or sec == self._last_saved_sec:
+            return
+        self._last_save_ts = now
+        self._last_saved_sec = sec
+        save_position(self.audiobook_path_str, current_pos)
+
+    def _set_duration(self, duration):
+        # The duration is fixed for a loaded file: cache it and format it once
+        self._duration = duration
+        # Conversion factors between seconds and the 0..100 progress scale
+        self._seconds_per_pct = duration / 100.0
+        self._pct_per_second = 100.0 / duration if duration > 0 else 0.0
+        self._total_time_str = self.format_time(duration)
+        self.total_time_label.config(text=self._total_time_str)
 
     def format_time(self, seconds):
-        minutes = int(seconds // 60)
-        seconds = int(seconds % 60)
-        return f"{minutes:2}:{seconds:2}"
-
-    def on_audio_finished(self):
-        self.is_playing = False
-        self.play_button.config(text="OUVIR")
+        return format_duration(seconds)
 
     def show(self):
         self.frame.grid()
 
     def hide(self):
         self.frame.grid_remove()
-        self.stop_update = True
-        if self.update_thread:
-            self.update_thread.join(timeout=1)
+        self.stop_progress_update()
         # Save current position to database
         if self.audio_player.is_file_loaded():
             pos = self.audio_player.get_position()
-            save_position(str(self.audiobook_path), pos)
+            save_position(self.audiobook_path_str, pos)
+            flush_positions()
         self.audio_player.stop() 
\ No newline at end of file
@@ -0,0 +1,30 @@
+"""
+Shared ttk styles for the Audiobook Reader application.
+Applied once at startup; screens only reference the style names.
+"""
+
+from tkinter import ttk
+
+
+def apply_styles(root):
+    """Configure the theme and all custom ttk styles used by the screens."""
+    style = ttk.Style(root)
+    style.theme_use('clam')  # Use clam theme for better appearance
+
+    # Style for even bigger buttons
+    style.configure("Big.TButton", font=("Arial", 40, "bold"), background="white", foreground="black")
+
+    # Progress bar style for bigger height
+    style.configure("Big.Horizontal.TScale",
+                    troughcolor="white",
+                    sliderthickness=60,  # Aumentei para garantir que fique maior
+                    thickness=40,
+                    sliderlength=80,
+                    length=100,
+                    background="black",  # Cor de fundo base do slider
+                    foreground="black")  # Cor de primeiro plano do slider (pode ser redundante com background em alguns temas)
+
+    # Garante que a cor azul se mantém em outros estados (pode ser necessário dependendo do tema)
+    style.map("Big.Horizontal.TScale",
+              background=[("active", "black"), ("!disabled", "black")],
+              foreground=[("active", "black"), ("!disabled", "black")])
@@ -1,172 +1,197 @@
 #!/usr/bin/env python3
 """
-Test script for the Audiobook Reader application.
-This script tests the basic functionality without requiring audio files.
+Test suite for the Audiobook Reader application.
+These tests check the basic functionality without requiring audio files.
+
+Run with: python -m pytest test_app.py
 """
 
 import sys
-import os
 from pathlib import Path
 
-# Add the project root to the Python path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import pytest
+
 
 def test_imports():
     """Test that all modules can be imported correctly."""
-    print("Testing imports...")
+    from gui.main_window import AudiobookReaderApp
+    from gui.library_screen import LibraryScreen
+    from gui.player_screen import PlayerScreen
     
-    try:
-        from gui.main_window import AudiobookReaderApp
-        from gui.library_screen import LibraryScreen
-        from gui.player_screen import PlayerScreen
-        print("✓ GUI modules imported successfully")
-    except ImportError as e:
-        print(f"✗ Failed to import GUI modules: {e}")
-        return False
+    from core.audio_player import AudioPlayer
+    from core.audiobook import Audiobook
     
-    try:
-        from core.audio_player import AudioPlayer
-        from core.audiobook import Audiobook
-        print("✓ Core modules imported successfully")
-    except ImportError as e:
-        print(f"✗ Failed to import core modules: {e}")
-        return False
+    from utils.file_utils import get_audio_files, validate_audio_file
+    from utils.audio_utils import format_duration, format_file_size
+
+
+def test_audiobook_class(tmp_path):
+    """Test the Audiobook class with a dummy file."""
+    from core.audiobook import Audiobook
     
-    try:
-        from utils.file_utils import get_audio_files, validate_audio_file
-        from utils.audio_utils import format_duration, format_file_size
-        print("✓ Utility modules imported successfully")
-    except ImportError as e:
-        print(f"✗ Failed to import utility modules: {e}")
-        return False
+    # Not a real audio file, but metadata is read from the file system only
+    test_file = tmp_path / "test_audio.mp3"
+    test_file.write_bytes(b"dummy audio content")
     
-    return True
+    audiobook = Audiobook(test_file)
+    assert audiobook.title == "test_audio"
+    assert audiobook.file_extension == ".mp3"
+    assert audiobook.file_size == len(b"dummy audio content")
 
-def test_audiobook_class():
-    """Test the Audiobook class with a dummy file."""
-    print("\nTesting Audiobook class...")
+
+def test_audio_cache_invalidates_on_change(tmp_path, monkeypatch):
+    """Test that cached audio info is reused until the file changes."""
+    import os
+    from utils import audio_cache
     
-    try:
-        from core.audiobook import Audiobook
-        
-        # Create a dummy file for testing
-        test_file = Path("test_audio.mp3")
-        test_file.write_text("dummy audio content")
-        
-        # This should fail gracefully since it's not a real audio file
-        try:
-            audiobook = Audiobook(test_file)
-            print("✓ Audiobook class created successfully")
-        except Exception as e:
-            print(f"✓ Audiobook class handled invalid file correctly: {e}")
-        
-        # Clean up
-        test_file.unlink(missing_ok=True)
-        
-    except Exception as e:
-        print(f"✗ Audiobook class test failed: {e}")
-        return False
-    
-    return True
+    monkeypatch.setattr(audio_cache, "INDEX_PATH", tmp_path / "audio_cache.json")
+    monkeypatch.setattr(audio_cache, "_index", None)
+    monkeypatch.setattr(audio_cache, "_dirty", False)
+    
+    test_file = tmp_path / "cached.mp3"
+    test_file.write_bytes(b"dummy audio content")
+    audio_cache.store(str(test_file), os.stat(test_file), {"duration": 123.0})
+    assert audio_cache.lookup(str(test_file), os.stat(test_file)) == {"duration": 123.0}
+    
+    audio_cache.save_index()
+    assert audio_cache.INDEX_PATH.exists()
+    
+    test_file.write_bytes(b"different, longer audio content")
+    assert audio_cache.lookup(str(test_file), os.stat(test_file)) is None
+
 
 def test_audio_player():
     """Test the AudioPlayer class initialization."""
-    print("\nTesting AudioPlayer class...")
+    from core.audio_player import AudioPlayer
     
+    player = AudioPlayer()
     try:
-        from core.audio_player import AudioPlayer
-        
-        player = AudioPlayer()
-        print("✓ AudioPlayer initialized successfully")
-        
-        # Test basic methods
-        assert not player.is_loaded()
-        assert not player.is_playing()
-        assert not player.is_paused()
-        print("✓ AudioPlayer state methods work correctly")
-        
-    except Exception as e:
-        print(f"✗ AudioPlayer test failed: {e}")
-        return False
-    
-    return True
+        # Test basic state methods
+        assert not player.is_file_loaded()
+        assert not player.is_audio_playing()
+        assert not player.is_audio_paused()
+    finally:
+        player.cleanup()
+
 
 def test_utils():
     """Test utility functions."""
-    print("\nTesting utility functions...")
-    
-    try:
-        from utils.audio_utils import format_duration, format_file_size
-        
-        # Test duration formatting
-        assert format_duration(65) == "01:05"
-        assert format_duration(3661) == "01:01:01"
-        print("✓ Duration formatting works correctly")
-        
-        # Test file size formatting
-        assert format_file_size(1024) == "1.0 KB"
-        assert format_file_size(1048576) == "1.0 MB"
-        print("✓ File size formatting works correctly")
-        
-    except Exception as e:
-        print(f"✗ Utility functions test failed: {e}")
-        return False
-    
-    return True
-
-def test_directory_structure():
+    from utils.audio_utils import format_duration, format_file_size
+    
+    # Test duration formatting
+    assert format_duration(65) == "01:05"
+    assert format_duration(3661) == "01:01:01"
+    
+    # Test file size formatting
+    assert format_file_size(1024) == "1.0 KB"
+    assert format_file_size(1048576) == "1.0 MB"
+    assert format_file_size(1023) == "1023.0 B"
+    assert format_file_size(1536) == "1.5 KB"
+    assert format_file_size(5 * 1024 ** 5) == "5120.0 TB"
+    assert format_file_size(0) == "0.0 B"
+    assert format_file_size(0.5) == "0.5 B"
+    assert format_file_size(1536.0) == "1.5 KB"
+
+
+def test_audio_filename_checks(tmp_path):
+    """Test the name-only and on-disk audio file checks."""
+    from utils.file_utils import is_audio_filename, validate_audio_file
+    
+    assert is_audio_filename("book.MP3")
+    assert not is_audio_filename("mp3")
+    assert not is_audio_filename("notes.txt")
+    # Same rule as Path.suffix: a bare dot-file has no extension
+    assert not is_audio_filename(".mp3")
+    assert is_audio_filename(".hidden.ogg")
+    
+    audio = tmp_path / "book.mp3"
+    audio.write_bytes(b"")
+    (tmp_path / "folder.mp3").mkdir()
+    assert validate_audio_file(str(audio))
+    assert not validate_audio_file(str(tmp_path / "missing.mp3"))
+    assert not validate_audio_file(str(tmp_path / "folder.mp3"))
+
+
+def test_missing_file_cache_evicts_expired_entries(tmp_path, monkeypatch):
+    """Test that the missing-file cache drops entries older than its TTL."""
+    from utils import file_utils
+    
+    clock = [1000.0]
+    monkeypatch.setattr(file_utils.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(file_utils, "_neg_cache", {})
+    
+    stale = str(tmp_path / "gone.mp3")
+    assert not file_utils.validate_audio_file(stale)
+    assert stale in file_utils._neg_cache
+    
+    clock[0] += file_utils.NEG_CACHE_TTL + 0.5
+    fresh = str(tmp_path / "also_gone.mp3")
+    assert not file_utils.validate_audio_file(fresh)
+    assert list(file_utils._neg_cache) == [fresh]
+
+
+@pytest.fixture
+def progress_db(tmp_path, monkeypatch):
+    """Point the progress database at a fresh file for one test."""
+    from utils import file_utils
+    
+    db_path = str(tmp_path / "progress.db")
+    monkeypatch.setenv("AUDIOBOOK_DB", db_path)
+    # DB_PATH is read at import time, and file_utils is already imported
+    monkeypatch.setattr(file_utils, "DB_PATH", db_path)
+    monkeypatch.setattr(file_utils, "_conn", None)
+    monkeypatch.setattr(file_utils, "_pending", {})
+    monkeypatch.setattr(file_utils, "_flush_timer", None)
+    yield db_path
+    file_utils.close_connection()
+
+
+def test_progress_table_migrates_to_without_rowid(progress_db):
+    """Test that an old rowid progress table is converted and keeps its rows."""
+    import sqlite3
+    from utils import file_utils
+    
+    conn = sqlite3.connect(progress_db)
+    conn.execute("CREATE TABLE progress (audiobook_path TEXT PRIMARY KEY, position REAL)")
+    conn.executemany("INSERT INTO progress VALUES (?, ?)", [("a.mp3", 12.5), ("b.mp3", 40.0)])
+    conn.commit()
+    conn.close()
+    
+    file_utils._ensure_schema(file_utils._get_connection())
+    
+    sql = file_utils._get_connection().execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'progress'").fetchone()[0]
+    assert "WITHOUT ROWID" in sql.upper()
+    assert file_utils.get_position("a.mp3") == 12.5
+    assert file_utils.get_position("b.mp3") == 40.0
+
+
+def test_get_positions_matches_get_position(progress_db):
+    """Test batched lookups across the parameter limit and with unflushed saves."""
+    from utils import file_utils
+    
+    paths = [f"book{i}.mp3" for i in range(file_utils._MAX_SQL_PARAMS + 100)]
+    for i, path in enumerate(paths):
+        file_utils.save_position(path, float(i))
+    file_utils.flush_positions()
+    
+    # Left pending: one update to a saved path and one brand-new path
+    file_utils.save_position(paths[-1], 1.5)
+    file_utils.save_position("new.mp3", 2.5)
+    queried = paths + ["new.mp3", "missing.mp3"]
+    
+    positions = file_utils.get_positions(queried)
+    assert positions[paths[-1]] == 1.5
+    assert "missing.mp3" not in positions
+    assert {p: positions.get(p, 0.0) for p in queried} == {
+        p: file_utils.get_position(p) for p in queried}
+
+
+@pytest.mark.parametrize("dir_path", ["gui", "core", "utils", "data/audiobooks"])
+def test_directory_structure(dir_path):
     """Test that the required directories exist."""
-    print("\nTesting directory structure...")
-    
-    required_dirs = [
-        "gui",
-        "core", 
-        "utils",
-        "data/audiobooks"
-    ]
-    
-    for dir_path in required_dirs:
-        if Path(dir_path).exists():
-            print(f"✓ Directory exists: {dir_path}")
-        else:
-            print(f"✗ Missing directory: {dir_path}")
-            return False
-    
-    return True
-
-def main():
-    """Run all tests."""
-    print("Audiobook Reader - Test Suite")
-    print("=" * 40)
-    
-    tests = [
-        test_imports,
-        test_audiobook_class,
-        test_audio_player,
-        test_utils,
-        test_directory_structure
-    ]
-    
-    passed = 0
-    total = len(tests)
-    
-    for test in tests:
-        if test():
-            passed += 1
-    
-    print("\n" + "=" * 40)
-    print(f"Test Results: {passed}/{total} tests passed")
-    
-    if passed == total:
-        print("🎉 All tests passed! The application should work correctly.")
-        print("\nTo run the application:")
-        print("1. Install dependencies: pip install -r requirements.txt")
-        print("2. Run the app: python main.py")
-    else:
-        print("❌ Some tests failed. Please check the errors above.")
-    
-    return passed == total
+    assert Path(dir_path).exists(), f"Missing directory: {dir_path}"
+
 
 if __name__ == "__main__":
-    success = main()
-    sys.exit(0 if success else 1) 
\ No newline at end of file
+    sys.exit(pytest.main([__file__]))
@@ -1,15 +1,40 @@
 """
 Utility functions for the Audiobook Reader application.
+
+Submodules are imported on first attribute access, so importing the
+package does not pull in every utility module at startup.
 """
 
-from .file_utils import get_audio_files, validate_audio_file, get_file_info
-from .audio_utils import format_duration, format_file_size, get_audio_duration
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    'get_audio_files': 'file_utils',
+    'scan_audio_library': 'file_utils',
+    'validate_audio_file': 'file_utils',
+    'is_audio_filename': 'file_utils',
+    'get_file_info': 'file_utils',
+    'format_duration': 'audio_utils',
+    'format_file_size': 'audio_utils',
+    'get_audio_duration': 'audio_utils',
+}
 
 __all__ = [
     'get_audio_files', 
+    'scan_audio_library',
     'validate_audio_file', 
+    'is_audio_filename',
     'get_file_info',
     'format_duration', 
     'format_file_size', 
     'get_audio_duration'
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Import the defining submodule lazily when a public name is accessed."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{module_name}", __name__)
+    return getattr(module, name)
@@ -0,0 +1,85 @@
+"""
+Persistent cache of audio file information for the Audiobook Reader application.
+
+Entries are keyed by file path and are only valid while the file's
+modification time (st_mtime_ns) and size are unchanged. This is the
+application's only persistent metadata cache.
+"""
+
+import atexit
+import json
+from pathlib import Path
+from typing import Dict, Optional
+
+INDEX_PATH = Path(__file__).parent.parent / 'data' / 'audio_cache.json'
+
+_index = None
+_dirty = False
+
+
+def load_index() -> Dict[str, dict]:
+    """Load the cache index from disk (only once per process).
+    
+    Returns:
+        Dictionary mapping file paths to cache entries
+    """
+    global _index
+    if _index is None:
+        try:
+            with open(INDEX_PATH, "r", encoding="utf-8") as f:
+                _index = json.load(f)
+        except (OSError, ValueError):
+            _index = {}
+    return _index
+
+
+def save_index() -> None:
+    """Write the cache index to disk if it has changed."""
+    global _dirty
+    if not _dirty or _index is None:
+        return
+    try:
+        INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(INDEX_PATH, "w", encoding="utf-8") as f:
+            json.dump(_index, f)
+        _dirty = False
+    except (OSError, TypeError) as e:
+        print(f"Error saving audio cache: {e}")
+
+
+def lookup(file_path: str, stat) -> Optional[dict]:
+    """Get the cached information for a file if it is still valid.
+    
+    Args:
+        file_path: Path to the audio file
+        stat: Current os.stat_result of the file
+        
+    Returns:
+        Copy of the cached information, or None on a miss or stale entry
+    """
+    entry = load_index().get(str(file_path))
+    if entry is None:
+        return None
+    if entry['mtime_ns'] != stat.st_mtime_ns or entry['size'] != stat.st_size:
+        return None
+    return dict(entry['info'])
+
+
+def store(file_path: str, stat, info: dict) -> None:
+    """Remember the information computed for a file.
+    
+    Args:
+        file_path: Path to the audio file
+        stat: os.stat_result the information was computed from
+        info: Information to cache
+    """
+    global _dirty
+    load_index()[str(file_path)] = {
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size,
+        'info': dict(info)
+    }
+    _dirty = True
+
+
+atexit.register(save_index)
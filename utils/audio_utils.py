@@ -2,13 +2,38 @@
 Audio utility functions for the Audiobook Reader application.
 """
 
+import functools
 from pathlib import Path
 from typing import Optional
 
+from core.formats import SUPPORTED_EXTS
+
+from . import audio_cache
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_mmss(sec_int: int) -> str:
+    """Format whole seconds (under one hour) as MM:SS."""
+    minutes, seconds = divmod(sec_int, 60)
+    return f"{minutes:02d}:{seconds:02d}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_hhmmss(sec_int: int) -> str:
+    """Format whole seconds as HH:MM:SS."""
+    hours, remainder = divmod(sec_int, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
 
 def format_duration(seconds: float) -> str:
     """Format duration in seconds to HH:MM:SS or MM:SS format.
     
+    Results are cached by whole second, so repeated calls with the same
+    second are a dictionary lookup.
+    
     Args:
         seconds: Duration in seconds
         
@@ -18,14 +43,10 @@ def format_duration(seconds: float) -> str:
     if seconds <= 0:
         return "00:00"
     
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    seconds = int(seconds % 60)
-    
-    if hours > 0:
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-    else:
-        return f"{minutes:02d}:{seconds:02d}"
+    sec_int = int(seconds)
+    if sec_int >= 3600:
+        return _fmt_hhmmss(sec_int)
+    return _fmt_mmss(sec_int)
 
 
 def format_file_size(size_bytes: int) -> str:
@@ -37,11 +58,12 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         Formatted size string
     """
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} TB"
+    if size_bytes < 1024:
+        # Also covers fractional and non-positive sizes, which have no bit length
+        return f"{size_bytes:.1f} B"
+    # Each unit is 2**10 larger, so the bit length selects it directly
+    idx = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * idx)):.1f} {_SIZE_UNITS[idx]}"
 
 
 def get_audio_duration(file_path: str) -> Optional[float]:
@@ -54,6 +76,18 @@ def get_audio_duration(file_path: str) -> Optional[float]:
         Duration in seconds, or None if unable to determine
     """
     try:
+        # Header-only probe: reads a few KB instead of decoding the file
+        from mutagen import File as MutagenFile
+        audio = MutagenFile(file_path)
+        if audio is not None and audio.info is not None:
+            return audio.info.length
+    except ImportError:
+        pass
+    except Exception as e:
+        print(f"Error reading audio metadata: {e}")
+    
+    try:
+        # Last resort: decode the whole file with pydub
         from pydub import AudioSegment
         audio = AudioSegment.from_file(file_path)
         return len(audio) / 1000.0  # Convert from milliseconds to seconds
@@ -111,6 +145,10 @@ def get_audio_info(file_path: str) -> dict:
         
         # Basic file info
         stat = path.stat()
+        cached = audio_cache.lookup(str(file_path), stat)
+        if cached is not None:
+            return cached
+        
         info['exists'] = True
         info['size'] = stat.st_size
         info['size_formatted'] = format_file_size(stat.st_size)
@@ -126,6 +164,8 @@ def get_audio_info(file_path: str) -> dict:
             info['duration'] = duration
             info['duration_formatted'] = format_duration(duration)
         
+        audio_cache.store(str(file_path), stat, info)
+        
     except Exception as e:
         print(f"Error getting audio info: {e}")
     
@@ -141,17 +181,16 @@ def is_supported_audio_format(file_path: str) -> bool:
     Returns:
         True if the file is a supported audio format
     """
-    supported_formats = {'.mp3', '.wav', '.ogg', '.flac', '.m4a', '.aac'}
-    return Path(file_path).suffix.lower() in supported_formats
+    return Path(file_path).suffix.lower() in SUPPORTED_EXTS
 
 
-def get_supported_formats() -> set:
+def get_supported_formats() -> frozenset:
     """Get the set of supported audio formats.
     
     Returns:
-        Set of supported audio file extensions
+        Frozen set of supported audio file extensions
     """
-    return {'.mp3', '.wav', '.ogg', '.flac', '.m4a', '.aac'}
+    return SUPPORTED_EXTS
 
 
 def format_bitrate(bitrate: int) -> str:
@@ -2,36 +2,277 @@
 File utility functions for the Audiobook Reader application.
 """
 
+import atexit
+import functools
+import logging
 import sqlite3
 from pathlib import Path
 import os
 import shutil
-from typing import List, Dict, Optional
+import threading
+import time
+from stat import S_ISREG
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, List, Dict, Iterable, Iterator, Optional, Tuple
 
-DB_PATH = Path(__file__).parent.parent / 'audiobook_progress.db'
+from core.formats import SUPPORTED_EXTS
+
+# Re-exported; audio_utils owns the single implementation
+from .audio_utils import format_file_size
+
+logger = logging.getLogger(__name__)
+
+# Progress database; set AUDIOBOOK_DB to keep it somewhere else (e.g. in tests)
+DB_PATH = os.environ.get('AUDIOBOOK_DB') or os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'audiobook_progress.db')
+
+# For str.endswith: only the last few characters need lowercasing
+_AUDIO_EXTS_TUPLE = tuple(sorted(SUPPORTED_EXTS))
+_AUDIO_EXT_MAXLEN = max(len(ext) for ext in SUPPORTED_EXTS)
+
+# SQL for the progress hot path; kept identical so sqlite3 reuses its prepared statements
+_SAVE_SQL = ('INSERT INTO progress (audiobook_path, position) VALUES (?, ?) '
+             'ON CONFLICT(audiobook_path) DO UPDATE SET position = excluded.position')
+_GET_SQL = 'SELECT position FROM progress WHERE audiobook_path = ?'
+_MAX_SQL_PARAMS = 500
+_CREATE_SQL = ('CREATE TABLE {table} (audiobook_path TEXT PRIMARY KEY, position REAL) '
+               'WITHOUT ROWID')
+
+# Opened once and shared; _conn_lock serializes all SQLite work on it
+_conn = None
+_conn_lock = threading.Lock()
+
+# Position updates waiting to be written, the batch currently being written,
+# and the timer that will write them. _pending_lock only ever guards these
+# dicts, so save_position never waits behind a database write.
+FLUSH_DELAY = 1.0
+_pending: Dict[str, float] = {}
+_flushing: Dict[str, float] = {}
+_flush_timer = None
+_pending_lock = threading.Lock()
+
+# Threads used by get_directory_size; stat calls release the GIL
+DIR_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Background pool for copy_audio_file_async, created on first use
+COPY_WORKERS = 2
+_copy_executor = None
+_copy_lock = threading.Lock()
+
+# Paths recently found missing -> time.monotonic() of the check, so polling
+# loops over removed files don't stat them again within NEG_CACHE_TTL.
+# Kept in insertion (= check time) order so expired entries sit at the front.
+NEG_CACHE_TTL = 1.0
+_neg_cache: Dict[str, float] = {}
+_neg_cache_lock = threading.Lock()
+
+def _known_missing(path: str) -> bool:
+    checked = _neg_cache.get(path)
+    if checked is None:
+        return False
+    if time.monotonic() - checked < NEG_CACHE_TTL:
+        return True
+    _forget_missing(path)
+    return False
+
+def _remember_missing(path: str):
+    now = time.monotonic()
+    with _neg_cache_lock:
+        # Re-insert so the dict stays ordered by check time
+        _neg_cache.pop(path, None)
+        _neg_cache[path] = now
+        # Evict expired entries so paths never queried again don't pile up
+        while True:
+            oldest = next(iter(_neg_cache))
+            if now - _neg_cache[oldest] < NEG_CACHE_TTL:
+                break
+            del _neg_cache[oldest]
+
+def _forget_missing(path: str):
+    with _neg_cache_lock:
+        _neg_cache.pop(path, None)
 
 def _get_connection():
-    conn = sqlite3.connect(DB_PATH)
-    conn.execute('''CREATE TABLE IF NOT EXISTS progress (
-        audiobook_path TEXT PRIMARY KEY,
-        position REAL
-    )''')
-    return conn
+    global _conn
+    if _conn is None:
+        conn = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None,
+                               cached_statements=256)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA busy_timeout=5000')
+        _ensure_schema(conn)
+        _conn = conn
+    return _conn
+
+def _ensure_schema(conn):
+    """Create the progress table, migrating older rowid tables to WITHOUT ROWID."""
+    row = conn.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'progress'").fetchone()
+    if row is None:
+        conn.execute(_CREATE_SQL.format(table='progress'))
+    elif 'WITHOUT ROWID' not in row[0].upper():
+        # Keyed lookups then go straight to the row instead of index -> rowid -> row
+        conn.execute('BEGIN')
+        try:
+            conn.execute(_CREATE_SQL.format(table='progress_new'))
+            conn.execute('INSERT OR IGNORE INTO progress_new (audiobook_path, position) '
+                         'SELECT audiobook_path, position FROM progress '
+                         'WHERE audiobook_path IS NOT NULL')
+            conn.execute('DROP TABLE progress')
+            conn.execute('ALTER TABLE progress_new RENAME TO progress')
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+def close_connection():
+    """Flush pending updates, let SQLite refresh its statistics and close the database."""
+    global _conn
+    flush_positions()
+    with _conn_lock:
+        if _conn is None:
+            return
+        try:
+            _conn.execute('PRAGMA optimize')
+        finally:
+            _conn.close()
+            _conn = None
 
 def save_position(audiobook_path, position):
-    conn = _get_connection()
-    with conn:
-        conn.execute('''REPLACE INTO progress (audiobook_path, position) VALUES (?, ?)''', (str(audiobook_path), position))
-    conn.close()
+    """Queue a position update; pending updates are written together shortly after."""
+    global _flush_timer
+    with _pending_lock:
+        _pending[str(audiobook_path)] = position
+        if _flush_timer is None:
+            _flush_timer = threading.Timer(FLUSH_DELAY, flush_positions)
+            _flush_timer.daemon = True
+            _flush_timer.start()
+
+def flush_positions():
+    """Write all pending position updates in a single transaction."""
+    global _flush_timer, _flushing
+    with _conn_lock:
+        # Take the batch out under the short lock; new saves start a fresh one
+        with _pending_lock:
+            if _flush_timer is not None:
+                _flush_timer.cancel()
+                _flush_timer = None
+            if not _pending:
+                return
+            batch = dict(_pending)
+            _pending.clear()
+            _flushing = batch
+        try:
+            conn = _get_connection()
+            conn.execute('BEGIN')
+            try:
+                conn.executemany(_SAVE_SQL, list(batch.items()))
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+        except Exception:
+            # Keep the batch for the next flush, unless a newer save superseded it
+            with _pending_lock:
+                for key, position in batch.items():
+                    _pending.setdefault(key, position)
+            raise
+        finally:
+            with _pending_lock:
+                _flushing = {}
 
 def get_position(audiobook_path):
-    conn = _get_connection()
-    cur = conn.cursor()
-    cur.execute('''SELECT position FROM progress WHERE audiobook_path = ?''', (str(audiobook_path),))
-    row = cur.fetchone()
-    conn.close()
+    key = str(audiobook_path)
+    with _pending_lock:
+        # Unflushed updates are the most recent value
+        if key in _pending:
+            return _pending[key]
+        if key in _flushing:
+            return _flushing[key]
+    with _conn_lock:
+        conn = _get_connection()
+        row = conn.execute(_GET_SQL, (key,)).fetchone()
     return row[0] if row else 0.0
 
+def get_positions(audiobook_paths: Iterable) -> Dict[str, float]:
+    """Look up saved positions for many audiobooks with batched queries.
+    
+    Paths without a saved position are left out; use .get(path, 0.0).
+    """
+    keys = list(dict.fromkeys(str(p) for p in audiobook_paths))
+    positions = {}
+    with _conn_lock:
+        conn = _get_connection()
+        # Stay under SQLite's host parameter limit on older builds
+        for start in range(0, len(keys), _MAX_SQL_PARAMS):
+            batch = keys[start:start + _MAX_SQL_PARAMS]
+            placeholders = ','.join('?' * len(batch))
+            positions.update(conn.execute(
+                f'SELECT audiobook_path, position FROM progress '
+                f'WHERE audiobook_path IN ({placeholders})', batch))
+    # Unflushed updates are the most recent value
+    with _pending_lock:
+        for key in keys:
+            if key in _pending:
+                positions[key] = _pending[key]
+            elif key in _flushing:
+                positions[key] = _flushing[key]
+    return positions
+
+atexit.register(close_connection)
+
+
+def _scandir_recursive(directory: str) -> Iterator[os.DirEntry]:
+    """Recursively yield DirEntry objects for all files under a directory.
+    
+    Uses os.scandir so file type checks reuse the information returned by
+    the directory listing instead of issuing a stat per entry. Directories
+    that cannot be read, or that vanish mid-scan, are skipped.
+    
+    Args:
+        directory: Path to the directory to scan
+        
+    Yields:
+        DirEntry for each file
+    """
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _scandir_recursive(entry.path)
+                elif entry.is_file():
+                    yield entry
+    except OSError:
+        return
+
+
+def _scan_directory_level(directory: str):
+    """Sum file sizes in one directory and collect its subdirectories.
+    
+    Args:
+        directory: Path to the directory to scan
+        
+    Returns:
+        Tuple of (total size in bytes, list of subdirectory paths)
+    """
+    total_size = 0
+    subdirs = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.is_file():
+                    try:
+                        total_size += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        # Removed between listing and stat
+                        continue
+    except OSError:
+        # Unreadable, or deleted after its parent listed it
+        pass
+    return total_size, subdirs
+
 
 def get_audio_files(directory: str) -> List[Path]:
     """Get all audio files from a directory.
@@ -42,18 +283,37 @@ def get_audio_files(directory: str) -> List[Path]:
     Returns:
         List of Path objects for audio files
     """
-    audio_extensions = {'.mp3', '.wav', '.ogg', '.flac', '.m4a', '.aac'}
     audio_files = []
     
-    dir_path = Path(directory)
-    if not dir_path.exists():
+    if not os.path.isdir(directory):
         return audio_files
     
-    for file_path in dir_path.rglob("*"):
-        if file_path.is_file() and file_path.suffix.lower() in audio_extensions:
-            audio_files.append(file_path)
+    for entry in _scandir_recursive(directory):
+        # Filter and sort on raw strings; only the final matches become Paths
+        if is_audio_filename(entry.name):
+            audio_files.append(entry.path)
     
-    return sorted(audio_files)
+    # Component-wise key keeps the ordering Path comparison would give
+    audio_files.sort(key=lambda p: p.split(os.sep))
+    return [Path(p) for p in audio_files]
+
+
+def is_audio_filename(name: str) -> bool:
+    """Check whether a file name has a supported audio extension.
+    
+    Pure string check with no file system access. Follows Path.suffix
+    semantics, so a bare dot-file such as '.mp3' has no extension.
+    
+    Args:
+        name: File name or path
+        
+    Returns:
+        True if the extension is a supported audio format, False otherwise
+    """
+    # Cheap reject first; most names in a scan are not audio files
+    if not name[-_AUDIO_EXT_MAXLEN:].lower().endswith(_AUDIO_EXTS_TUPLE):
+        return False
+    return os.path.splitext(name)[1].lower() in SUPPORTED_EXTS
 
 
 def validate_audio_file(file_path: str) -> bool:
@@ -65,40 +325,118 @@ def validate_audio_file(file_path: str) -> bool:
     Returns:
         True if the file is a valid audio file, False otherwise
     """
-    audio_extensions = {'.mp3', '.wav', '.ogg', '.flac', '.m4a', '.aac'}
-    
-    path = Path(file_path)
-    if not path.exists():
+    file_path = os.fspath(file_path)
+    if not is_audio_filename(file_path) or _known_missing(file_path):
         return False
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
+        _remember_missing(file_path)
+        return False
+    except OSError:
+        return False
+    return S_ISREG(st.st_mode)
+
+
+_FILE_INFO_FIELDS = ('name', 'stem', 'suffix', 'size', 'size_formatted', 'modified', 'exists')
+_ALL_FILE_INFO_FIELDS = frozenset(_FILE_INFO_FIELDS)
+
+
+@functools.lru_cache(maxsize=4096)
+def _file_info(file_path: str, mtime_ns: int, mtime: float, size: int,
+               fields: frozenset) -> Dict[str, any]:
+    """Build the get_file_info dict; memoized on the path and its mtime/size."""
+    info = {}
+    if 'size' in fields:
+        info['size'] = size
+    if 'size_formatted' in fields:
+        info['size_formatted'] = format_file_size(size)
+    if 'modified' in fields:
+        info['modified'] = mtime
+    
+    # Plain string operations; same results as Path.name/stem/suffix for files
+    name = os.path.basename(file_path)
+    stem, suffix = os.path.splitext(name)
+    if 'name' in fields:
+        info['name'] = name
+    if 'stem' in fields:
+        info['stem'] = stem
+    if 'suffix' in fields:
+        info['suffix'] = suffix.lower()
+    if 'exists' in fields:
+        info['exists'] = True
     
-    return path.suffix.lower() in audio_extensions
+    return info
 
 
-def get_file_info(file_path: str) -> Dict[str, any]:
+def get_file_info(file_path: str, *, include: Optional[Iterable[str]] = None) -> Dict[str, any]:
     """Get information about a file.
     
+    The file is stat'ed on every call, but the dict is only rebuilt when its
+    modification time or size has changed since the last call.
+    
     Args:
         file_path: Path to the file
+        include: Keys to compute (see _FILE_INFO_FIELDS); all of them if None.
+            Only the requested values are built.
         
     Returns:
         Dictionary containing file information
     """
-    path = Path(file_path)
+    fields = _ALL_FILE_INFO_FIELDS if include is None else frozenset(include)
+    file_path = os.fspath(file_path)
+    if _known_missing(file_path):
+        return {}
     
-    if not path.exists():
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
+        _remember_missing(file_path)
         return {}
+    except OSError:
+        return {}
+    
+    # Copy so callers can't mutate the cached entry
+    return dict(_file_info(file_path, stat.st_mtime_ns, stat.st_mtime, stat.st_size, fields))
+
+
+def _copy_file(src: str, dst: str):
+    """Copy a file's data and timestamps, in-kernel where the OS allows it.
+    
+    Uses os.copy_file_range (Linux) so the data never passes through a
+    user-space buffer; falls back to shutil.copy2 when it is unavailable,
+    the file systems do not support it, or it stops short of the full size
+    (some FUSE/network mounts return 0 early).
     
-    stat = path.stat()
+    Args:
+        src: Path to the source file
+        dst: Path to the destination file
+    """
+    if not hasattr(os, 'copy_file_range'):
+        shutil.copy2(src, dst)
+        return
+    
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+            stat = os.fstat(src_fd)
+            copied = 0
+            while copied < stat.st_size:
+                n = os.copy_file_range(src_fd, dst_fd, 2**31 - 1)
+                if not n:
+                    break
+                copied += n
+    except OSError:
+        shutil.copy2(src, dst)
+        return
+    
+    if copied != stat.st_size:
+        # Partial in-kernel copy; redo it through user space
+        shutil.copy2(src, dst)
+        return
     
-    return {
-        'name': path.name,
-        'stem': path.stem,
-        'suffix': path.suffix.lower(),
-        'size': stat.st_size,
-        'size_formatted': format_file_size(stat.st_size),
-        'modified': stat.st_mtime,
-        'exists': True
-    }
+    os.chmod(dst, stat.st_mode & 0o7777)
+    os.utime(dst, ns=(stat.st_atime_ns, stat.st_mtime_ns))
 
 
 def copy_audio_file(source_path: str, dest_directory: str) -> Optional[str]:
@@ -115,7 +453,10 @@ def copy_audio_file(source_path: str, dest_directory: str) -> Optional[str]:
         source = Path(source_path)
         dest_dir = Path(dest_directory)
         
+        if _known_missing(str(source)):
+            return None
         if not source.exists():
+            _remember_missing(str(source))
             return None
         
         # Create destination directory if it doesn't exist
@@ -123,15 +464,43 @@ def copy_audio_file(source_path: str, dest_directory: str) -> Optional[str]:
         
         # Copy the file
         dest_path = dest_dir / source.name
-        shutil.copy2(source, dest_path)
+        _copy_file(str(source), str(dest_path))
+        _forget_missing(str(dest_path))
         
         return str(dest_path)
         
-    except Exception as e:
-        print(f"Error copying file: {e}")
+    except Exception:
+        logger.exception("Error copying file: %s", source_path)
         return None
 
 
+def copy_audio_file_async(source_path: str, dest_directory: str,
+                          callback: Optional[Callable[[Optional[str]], None]] = None) -> Future:
+    """Copy an audio file on a background thread.
+    
+    The copy runs on a small shared pool so the calling (GUI) thread stays
+    responsive. The callback, if given, runs on the worker thread; Tk
+    callers should hand it back to the main loop with root.after.
+    
+    Args:
+        source_path: Path to the source audio file
+        dest_directory: Destination directory
+        callback: Called with the copied path, or None if the copy failed
+        
+    Returns:
+        Future resolving to the same value as copy_audio_file
+    """
+    global _copy_executor
+    with _copy_lock:
+        if _copy_executor is None:
+            _copy_executor = ThreadPoolExecutor(max_workers=COPY_WORKERS,
+                                                thread_name_prefix='audio-copy')
+    future = _copy_executor.submit(copy_audio_file, source_path, dest_directory)
+    if callback is not None:
+        future.add_done_callback(lambda f: callback(f.result()))
+    return future
+
+
 def delete_audio_file(file_path: str) -> bool:
     """Delete an audio file.
     
@@ -141,15 +510,18 @@ def delete_audio_file(file_path: str) -> bool:
     Returns:
         True if deletion was successful, False otherwise
     """
+    file_path = os.fspath(file_path)
+    # No negative-cache shortcut here: the file may have been re-created since
     try:
-        path = Path(file_path)
-        if path.exists():
-            path.unlink()
-            return True
+        os.unlink(file_path)
+    except FileNotFoundError:
+        _remember_missing(file_path)
         return False
-    except Exception as e:
-        print(f"Error deleting file: {e}")
+    except OSError:
+        logger.exception("Error deleting file: %s", file_path)
         return False
+    _remember_missing(file_path)
+    return True
 
 
 def ensure_directory_exists(directory: str) -> bool:
@@ -165,14 +537,18 @@ def ensure_directory_exists(directory: str) -> bool:
         path = Path(directory)
         path.mkdir(parents=True, exist_ok=True)
         return True
-    except Exception as e:
-        print(f"Error creating directory: {e}")
+    except Exception:
+        logger.exception("Error creating directory: %s", directory)
         return False
 
 
 def get_directory_size(directory: str) -> int:
     """Get the total size of all files in a directory.
     
+    Sizes come from DirEntry.stat(follow_symlinks=False), so a symlink to a
+    file counts as the size of the link itself, not of its target, and
+    symlinked directories are not descended into.
+    
     Args:
         directory: Path to the directory
         
@@ -180,29 +556,54 @@ def get_directory_size(directory: str) -> int:
         Total size in bytes
     """
     total_size = 0
-    dir_path = Path(directory)
     
-    if not dir_path.exists():
+    if not os.path.isdir(directory):
         return 0
     
-    for file_path in dir_path.rglob("*"):
-        if file_path.is_file():
-            total_size += file_path.stat().st_size
+    # Workers list one directory each and hand subdirectories back here, so
+    # several stat-heavy listings are in flight at once on slow filesystems
+    with ThreadPoolExecutor(max_workers=DIR_SCAN_WORKERS) as executor:
+        pending = {executor.submit(_scan_directory_level, directory)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                size, subdirs = future.result()
+                total_size += size
+                pending.update(executor.submit(_scan_directory_level, subdir)
+                               for subdir in subdirs)
     
     return total_size
 
 
-def format_file_size(size_bytes: int) -> str:
-    """Format file size in human-readable format.
+def scan_audio_library(directory: str) -> Tuple[List[Path], int, Dict[Path, int]]:
+    """Collect audio files and directory size in a single traversal.
+    
+    Equivalent to calling get_audio_files and get_directory_size on the same
+    directory, but lists and stats each entry only once.
     
     Args:
-        size_bytes: Size in bytes
+        directory: Path to the directory to scan
         
     Returns:
-        Formatted size string
+        Tuple of (sorted audio file Paths, total size in bytes of all files,
+        mapping of each audio file Path to its size in bytes)
     """
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} TB" 
\ No newline at end of file
+    if not os.path.isdir(directory):
+        return [], 0, {}
+    
+    total_size = 0
+    audio_sizes = {}
+    for entry in _scandir_recursive(directory):
+        try:
+            size = entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            # Removed between listing and stat
+            continue
+        total_size += size
+        if is_audio_filename(entry.name):
+            audio_sizes[entry.path] = size
+    
+    audio_paths = sorted(audio_sizes, key=lambda p: p.split(os.sep))
+    audio_files = [Path(p) for p in audio_paths]
+    file_sizes = {path: audio_sizes[p] for path, p in zip(audio_files, audio_paths)}
+    return audio_files, total_size, file_sizes